@@ -1,16 +1,70 @@
 #!/usr/bin/env python3
 """Example usage of the XSD to OpenAPI converter."""
 
-import json
+import io
+import os
 import sys
+import zipfile
+from itertools import islice
 from pathlib import Path
 
-import yaml
-
-# Add src to path for development
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from xsd_to_openapi import XSDConverter
+from xsd_to_openapi.serialization import write_json, write_yaml
+
+
+def _has_ref(node):
+    """Return True if a schema fragment contains a $ref anywhere below it."""
+    if isinstance(node, dict):
+        return "$ref" in node or any(_has_ref(value) for value in node.values())
+    if isinstance(node, list):
+        return any(_has_ref(value) for value in node)
+    return False
+
+
+HAS_ONEOF, HAS_ENUM, HAS_REF = 1, 2, 4
+
+
+def _classify(schema):
+    """Return a bitmask of the HAS_* features present in a schema."""
+    mask = 0
+    if "oneOf" in schema:
+        mask |= HAS_ONEOF
+    if "enum" in schema:
+        mask |= HAS_ENUM
+    if any(_has_ref(prop) for prop in schema.get("properties", {}).values()):
+        mask |= HAS_REF
+    return mask
+
+
+def _write_report(f, xsd_file, openapi_spec, choice_schemas, enum_schemas, ref_schemas):
+    """Write the plain-text conversion report."""
+    schemas = openapi_spec["components"]["schemas"]
+    f.write("XSD to OpenAPI Conversion Report\n")
+    f.write("=" * 35 + "\n\n")
+    f.write(f"Source XSD: {xsd_file}\n")
+    f.write(f"Target Namespace: {openapi_spec['info'].get('description', 'N/A')}\n")
+    f.write(f"Conversion Date: {__import__('datetime').datetime.now()}\n\n")
+
+    f.write(f"OpenAPI Output:\n")
+    f.write(f"  Total Schemas: {len(schemas)}\n")
+    f.write(f"  Schemas with oneOf: {len(choice_schemas)}\n")
+    f.write(f"  Schemas with enums: {len(enum_schemas)}\n")
+    f.write(f"  Schemas with references: {len(ref_schemas)}\n\n")
+
+    if choice_schemas:
+        f.write("Schemas with Choice Elements (oneOf):\n")
+        for name in choice_schemas:
+            f.write(f"  - {name}: {len(schemas[name]['oneOf'])} options\n")
+        f.write("\n")
+
+    if enum_schemas:
+        f.write("Enumeration Schemas:\n")
+        for name in enum_schemas:
+            enum = schemas[name]["enum"]
+            f.write(f"  - {name}: {enum[:5]}")  # Show first 5
+            if len(enum) > 5:
+                f.write(f" (and {len(enum) - 5} more)")
+            f.write("\n")
 
 
 def demonstrate_conversion():
@@ -68,13 +122,12 @@ def demonstrate_conversion():
         ref_schemas = []
 
         for name, schema in schemas.items():
-            if "oneOf" in schema:
+            mask = _classify(schema)
+            if mask & HAS_ONEOF:
                 choice_schemas.append(name)
-            if "enum" in schema:
+            if mask & HAS_ENUM:
                 enum_schemas.append(name)
-            if isinstance(schema, dict) and any(
-                "$ref" in str(prop) for prop in schema.get("properties", {}).values()
-            ):
+            if mask & HAS_REF:
                 ref_schemas.append(name)
 
         print(f"  - Schemas with choices (oneOf): {len(choice_schemas)}")
@@ -88,55 +141,48 @@ def demonstrate_conversion():
         # Generate output filename based on input
         base_name = xsd_file.stem
 
-        # Save JSON version
         json_file = output_dir / f"{base_name}_openapi.json"
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(openapi_spec, f, indent=2, ensure_ascii=False)
-        print(f"📄 OpenAPI JSON: {json_file}")
-
-        # Save YAML version
         yaml_file = output_dir / f"{base_name}_openapi.yaml"
-        with open(yaml_file, "w", encoding="utf-8") as f:
-            yaml.dump(openapi_spec, f, default_flow_style=False, sort_keys=False)
-        print(f"📄 OpenAPI YAML: {yaml_file}")
-
-        # Save analysis report
         report_file = output_dir / f"{base_name}_report.txt"
-        with open(report_file, "w", encoding="utf-8") as f:
-            f.write("XSD to OpenAPI Conversion Report\n")
-            f.write("=" * 35 + "\n\n")
-            f.write(f"Source XSD: {xsd_file}\n")
-            f.write(
-                f"Target Namespace: {openapi_spec['info'].get('description', 'N/A')}\n"
-            )
-            f.write(f"Conversion Date: {__import__('datetime').datetime.now()}\n\n")
-
-            f.write(f"OpenAPI Output:\n")
-            f.write(f"  Total Schemas: {len(schemas)}\n")
-            f.write(f"  Schemas with oneOf: {len(choice_schemas)}\n")
-            f.write(f"  Schemas with enums: {len(enum_schemas)}\n")
-            f.write(f"  Schemas with references: {len(ref_schemas)}\n\n")
-
-            if choice_schemas:
-                f.write("Schemas with Choice Elements (oneOf):\n")
-                for name in choice_schemas:
-                    schema = schemas[name]
-                    if "oneOf" in schema:
-                        f.write(f"  - {name}: {len(schema['oneOf'])} options\n")
-                f.write("\n")
-
-            if enum_schemas:
-                f.write("Enumeration Schemas:\n")
-                for name in enum_schemas:
-                    schema = schemas[name]
-                    if "enum" in schema:
-                        enum_values = schema["enum"][:5]  # Show first 5
-                        f.write(f"  - {name}: {enum_values}")
-                        if len(schema["enum"]) > 5:
-                            f.write(f" (and {len(schema['enum']) - 5} more)")
-                        f.write("\n")
-
-        print(f"📄 Analysis report: {report_file}")
+
+        if os.environ.get("XSD_BUNDLE") == "1":
+            # Write all artifacts into one archive; deflate level 1 is cheap
+            bundle_file = output_dir / f"{base_name}_bundle.zip"
+            with zipfile.ZipFile(
+                bundle_file, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+            ) as zf:
+                with zf.open(json_file.name, "w") as f:
+                    write_json(openapi_spec, f)
+                with zf.open(yaml_file.name, "w") as raw:
+                    with io.TextIOWrapper(raw, encoding="utf-8") as f:
+                        write_yaml(openapi_spec, f)
+                with zf.open(report_file.name, "w") as raw:
+                    with io.TextIOWrapper(raw, encoding="utf-8") as f:
+                        _write_report(
+                            f,
+                            xsd_file,
+                            openapi_spec,
+                            choice_schemas,
+                            enum_schemas,
+                            ref_schemas,
+                        )
+            print(f"📦 Bundle: {bundle_file}")
+        else:
+            # Save JSON version
+            with open(json_file, "wb") as f:
+                write_json(openapi_spec, f)
+            print(f"📄 OpenAPI JSON: {json_file}")
+
+            # Save YAML version
+            yaml_file.write_text(write_yaml(openapi_spec), encoding="utf-8")
+            print(f"📄 OpenAPI YAML: {yaml_file}")
+
+            # Save analysis report
+            with open(report_file, "w", encoding="utf-8") as f:
+                _write_report(
+                    f, xsd_file, openapi_spec, choice_schemas, enum_schemas, ref_schemas
+                )
+            print(f"📄 Analysis report: {report_file}")
 
         # Step 4: Show key examples
         print(f"\n🎯 Step 4: Key Schema Examples")
@@ -157,7 +203,7 @@ def demonstrate_conversion():
 
         # Add other interesting schemas
         if not example_schemas:
-            example_schemas = list(schemas.keys())[:3]
+            example_schemas = list(islice(schemas, 3))
 
         for schema_name in example_schemas[:3]:  # Show max 3 examples
             schema = schemas[schema_name]
@@ -171,7 +217,7 @@ def demonstrate_conversion():
                     for prop_name in schema["properties"]:
                         print(f"    - {prop_name}")
                 else:
-                    prop_names = list(schema["properties"].keys())[:3]
+                    prop_names = list(islice(schema["properties"], 3))
                     print(f"    - {', '.join(prop_names)} (and {prop_count - 3} more)")
 
             if "oneOf" in schema:
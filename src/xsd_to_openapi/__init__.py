@@ -3,9 +3,22 @@
 A Python tool to convert XML Schema Definition (XSD) files to OpenAPI 3.0+ specifications.
 """
 
-from .converter import XSDConverter
+from typing import TYPE_CHECKING, Any
+
 from .models import OpenAPISchema
 
+if TYPE_CHECKING:
+    from .converter import XSDConverter
+
 __all__ = ["XSDConverter", "OpenAPISchema"]
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    """Import the converter (and with it xmlschema) on first access."""
+    if name == "XSDConverter":
+        from .converter import XSDConverter
+
+        return XSDConverter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
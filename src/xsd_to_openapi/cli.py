@@ -1,14 +1,135 @@
 """Command-line interface for XSD to OpenAPI converter."""
 
-import json
+import cmd
+import cProfile
+import hashlib
+import pickle
+import pstats
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import click
-import yaml
+from xmlschema import XMLSchema
 
+from . import __version__
 from .converter import XSDConverter
+from .models import SchemaInfo, ValidationResult
+from .serialization import write_json, write_yaml
+
+CACHE_DIR = Path.home() / ".cache" / "xsd_to_openapi"
+
+
+def _convert_cached(converter: XSDConverter, input_file: Path) -> Dict[str, Any]:
+    """Convert an XSD file, reusing the spec generated by a previous run.
+
+    Cache entries are keyed by the absolute path, modification time and size
+    of the XSD file and by the converter options, so editing the file or
+    changing an option invalidates its entry. Caching is best effort: a spec
+    that cannot be stored is still returned.
+    """
+    stat = input_file.stat()
+    options = (
+        converter.title,
+        converter.version,
+        converter.description,
+        converter.validate_output,
+    )
+    key = hashlib.sha1(
+        f"{__version__}|{input_file.resolve()}|{stat.st_mtime_ns}|"
+        f"{stat.st_size}|{options!r}".encode()
+    ).hexdigest()
+    cache_file = CACHE_DIR / f"{key}.pkl"
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                cached: Dict[str, Any] = pickle.load(f)
+            return cached
+        except Exception:
+            # Stale or corrupt entry - fall through and rebuild it
+            pass
+
+    openapi_spec = converter.convert_file(input_file)
+    tmp_file = cache_file.with_suffix(".tmp")
+    try:
+        data = pickle.dumps(openapi_spec, protocol=pickle.HIGHEST_PROTOCOL)
+        # Only cache specs that survive the round trip unchanged
+        if pickle.loads(data) == openapi_spec:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_bytes(data)
+            tmp_file.replace(cache_file)
+    except Exception:
+        # A spec that cannot be cached is still a valid result
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+    return openapi_spec
+
+
+def _write_spec(
+    openapi_spec: Dict[str, Any], output_file: Path, output_format: str
+) -> None:
+    """Write an OpenAPI specification in the requested format.
+
+    The spec is written to a temporary file next to ``output_file`` and
+    renamed into place, so a failed write never leaves a partial file.
+    """
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_name(f".{output_file.name}.tmp")
+
+    try:
+        if output_format.lower() == "json":
+            with open(tmp_file, "wb") as f:
+                write_json(openapi_spec, f)
+        else:
+            tmp_file.write_text(write_yaml(openapi_spec), encoding="utf-8")
+        tmp_file.replace(output_file)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+
+def _echo_validation_result(validation_result: ValidationResult) -> bool:
+    """Print a validation result and return whether the schema is valid."""
+    if validation_result.is_valid:
+        click.echo("✅ XSD file is valid and ready for conversion")
+        if validation_result.warnings:
+            click.echo("\nWarnings:")
+            for warning in validation_result.warnings:
+                click.echo(f"  ⚠️  {warning}")
+        return True
+
+    click.echo("❌ XSD file has validation errors:")
+    for error in validation_result.errors:
+        click.echo(f"  ❌ {error}")
+    return False
+
+
+def _echo_schema_info(schema_info: SchemaInfo) -> None:
+    """Print the schema information shown by the info command."""
+    click.echo(f"\n📊 Schema Information:")
+    click.echo(f"  Target Namespace: {schema_info.target_namespace or 'None'}")
+    click.echo(f"  Element Form Default: {schema_info.element_form_default}")
+    click.echo(f"  Attribute Form Default: {schema_info.attribute_form_default}")
+
+    click.echo(f"\n📈 Statistics:")
+    click.echo(f"  Complex Types: {schema_info.complex_types_count}")
+    click.echo(f"  Simple Types: {schema_info.simple_types_count}")
+    click.echo(f"  Global Elements: {schema_info.global_elements_count}")
+    click.echo(f"  Choice Elements: {schema_info.choice_elements_count}")
+    click.echo(f"  Imports: {schema_info.imports_count}")
+    click.echo(f"  Includes: {schema_info.includes_count}")
+
+    if schema_info.imports:
+        click.echo(f"\n📥 Imports:")
+        for imp in schema_info.imports:
+            click.echo(f"  - {imp}")
+
+    if schema_info.includes:
+        click.echo(f"\n📄 Includes:")
+        for inc in schema_info.includes:
+            click.echo(f"  - {inc}")
 
 
 @click.group()
@@ -49,8 +170,24 @@ def main() -> None:
 )
 @click.option(
     "--validate/--no-validate",
-    default=True,
-    help="Validate generated OpenAPI schema (default: validate)",
+    default=False,
+    help="Accepted for compatibility; output validation is not implemented yet",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    help=f"Reuse specs cached in {CACHE_DIR} (default: no-cache)",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Convert named types in N worker processes (0: one per CPU)",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Print the top 20 functions by cumulative time to stderr",
 )
 @click.option(
     "--verbose",
@@ -66,6 +203,9 @@ def convert(
     api_version: str,
     description: Optional[str],
     validate: bool,
+    cache: bool,
+    workers: Optional[int],
+    profile: bool,
     verbose: bool,
 ) -> None:
     """Convert XSD file to OpenAPI specification.
@@ -84,31 +224,31 @@ def convert(
             version=api_version,
             description=description,
             validate_output=validate,
+            workers=workers,
         )
 
         # Convert XSD to OpenAPI
         if verbose:
             click.echo("Parsing XSD schema...")
 
-        openapi_spec = converter.convert_file(input_file)
+        profiler = cProfile.Profile() if profile else None
+        if profiler is not None:
+            profiler.enable()
+
+        if cache:
+            openapi_spec = _convert_cached(converter, input_file)
+        else:
+            openapi_spec = converter.convert_file(input_file)
 
         if verbose:
             click.echo("Generating OpenAPI specification...")
 
-        # Write output file
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        _write_spec(openapi_spec, output_file, output_format)
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            if output_format.lower() == "json":
-                json.dump(openapi_spec, f, indent=2, ensure_ascii=False)
-            else:
-                yaml.dump(
-                    openapi_spec,
-                    f,
-                    default_flow_style=False,
-                    allow_unicode=True,
-                    sort_keys=False,
-                )
+        if profiler is not None:
+            profiler.disable()
+            stats = pstats.Stats(profiler, stream=sys.stderr)
+            stats.sort_stats("cumulative").print_stats(20)
 
         if verbose:
             click.echo(f"Successfully converted XSD to OpenAPI: {output_file}")
@@ -124,6 +264,101 @@ def convert(
         sys.exit(1)
 
 
+@main.command(name="convert-many")
+@click.argument(
+    "input_files", nargs=-1, required=True, type=click.Path(exists=True, path_type=Path)
+)
+@click.option(
+    "--output-dir",
+    "-o",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path("."),
+    help="Directory for the generated specifications (default: current directory)",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["yaml", "json"], case_sensitive=False),
+    default="yaml",
+    help="Output format (default: yaml)",
+)
+@click.option(
+    "--version",
+    "api_version",
+    default="1.0.0",
+    help="API version (default: 1.0.0)",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=False,
+    help=f"Reuse specs cached in {CACHE_DIR} (default: no-cache)",
+)
+@click.option(
+    "--verbose",
+    "-v",
+    is_flag=True,
+    help="Enable verbose output",
+)
+def convert_many(
+    input_files: Tuple[Path, ...],
+    output_dir: Path,
+    output_format: str,
+    api_version: str,
+    cache: bool,
+    verbose: bool,
+) -> None:
+    """Convert several XSD files in one run.
+
+    Each INPUT_FILE is written to OUTPUT_DIR as <name>.yaml or <name>.json;
+    input files with the same name are rejected before anything is written.
+    A single converter is reused for all files, which avoids starting a new
+    process per file in scripted batch conversions.
+    """
+    suffix = f".{output_format.lower()}"
+    output_files = [output_dir / f"{f.stem}{suffix}" for f in input_files]
+
+    # Inputs with the same name would overwrite each other's output
+    inputs_by_output: Dict[Path, List[Path]] = {}
+    for input_file, output_file in zip(input_files, output_files):
+        inputs_by_output.setdefault(output_file, []).append(input_file)
+    clashes = {out: ins for out, ins in inputs_by_output.items() if len(ins) > 1}
+    if clashes:
+        for output_file, clashing in clashes.items():
+            names = ", ".join(str(f) for f in clashing)
+            click.echo(
+                f"Error: {names} would overwrite each other in {output_file}", err=True
+            )
+        sys.exit(1)
+
+    converter = XSDConverter(version=api_version)
+    failed = 0
+
+    for input_file, output_file in zip(input_files, output_files):
+        try:
+            if verbose:
+                click.echo(f"Converting {input_file} to {output_file}")
+
+            if cache:
+                openapi_spec = _convert_cached(converter, input_file)
+            else:
+                openapi_spec = converter.convert_file(input_file)
+
+            _write_spec(openapi_spec, output_file, output_format)
+            click.echo(f"Conversion complete: {output_file}")
+
+        except Exception as e:
+            failed += 1
+            click.echo(f"Error converting {input_file}: {e}", err=True)
+            if verbose:
+                import traceback
+
+                traceback.print_exc()
+
+    if failed:
+        click.echo(f"{failed} of {len(input_files)} files failed", err=True)
+        sys.exit(1)
+
+
 @main.command()
 @click.argument("input_file", type=click.Path(exists=True, path_type=Path))
 def validate(input_file: Path) -> None:
@@ -137,16 +372,7 @@ def validate(input_file: Path) -> None:
         converter = XSDConverter()
         validation_result = converter.validate_xsd(input_file)
 
-        if validation_result.is_valid:
-            click.echo("✅ XSD file is valid and ready for conversion")
-            if validation_result.warnings:
-                click.echo("\nWarnings:")
-                for warning in validation_result.warnings:
-                    click.echo(f"  ⚠️  {warning}")
-        else:
-            click.echo("❌ XSD file has validation errors:")
-            for error in validation_result.errors:
-                click.echo(f"  ❌ {error}")
+        if not _echo_validation_result(validation_result):
             sys.exit(1)
 
     except Exception as e:
@@ -167,33 +393,103 @@ def info(input_file: Path) -> None:
         converter = XSDConverter()
         schema_info = converter.analyze_schema(input_file)
 
-        click.echo(f"\n📊 Schema Information:")
-        click.echo(f"  Target Namespace: {schema_info.target_namespace or 'None'}")
-        click.echo(f"  Element Form Default: {schema_info.element_form_default}")
-        click.echo(f"  Attribute Form Default: {schema_info.attribute_form_default}")
-
-        click.echo(f"\n📈 Statistics:")
-        click.echo(f"  Complex Types: {schema_info.complex_types_count}")
-        click.echo(f"  Simple Types: {schema_info.simple_types_count}")
-        click.echo(f"  Global Elements: {schema_info.global_elements_count}")
-        click.echo(f"  Choice Elements: {schema_info.choice_elements_count}")
-        click.echo(f"  Imports: {schema_info.imports_count}")
-        click.echo(f"  Includes: {schema_info.includes_count}")
-
-        if schema_info.imports:
-            click.echo(f"\n📥 Imports:")
-            for imp in schema_info.imports:
-                click.echo(f"  - {imp}")
-
-        if schema_info.includes:
-            click.echo(f"\n📄 Includes:")
-            for inc in schema_info.includes:
-                click.echo(f"  - {inc}")
+        _echo_schema_info(schema_info)
 
     except Exception as e:
         click.echo(f"Error analyzing XSD: {e}", err=True)
         sys.exit(1)
 
 
+class _ConverterShell(cmd.Cmd):
+    """Interactive shell that keeps a parsed XSD schema in memory."""
+
+    intro = "XSD to OpenAPI shell. Type help or ? to list commands."
+    prompt = "(xsd-to-openapi) "
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._converter = XSDConverter()
+        self._schema: Optional[XMLSchema] = None
+
+    def emptyline(self) -> bool:
+        """Do nothing on an empty line instead of repeating the last command."""
+        return False
+
+    def do_load(self, arg: str) -> None:
+        """load XSD_FILE: parse an XSD file and keep it for later commands"""
+        if not arg:
+            click.echo("Usage: load XSD_FILE")
+            return
+        try:
+            self._schema = XMLSchema(arg)
+            click.echo(f"Loaded {arg}")
+        except Exception as e:
+            click.echo(f"Error loading XSD: {e}", err=True)
+
+    def do_convert(self, arg: str) -> None:
+        """convert OUTPUT_FILE [yaml|json]: convert the loaded schema"""
+        args = arg.split()
+        if not args or len(args) > 2:
+            click.echo("Usage: convert OUTPUT_FILE [yaml|json]")
+            return
+        if self._schema is None:
+            click.echo("No schema loaded, use: load XSD_FILE")
+            return
+
+        output_file = Path(args[0])
+        if len(args) == 2:
+            output_format = args[1].lower()
+            if output_format not in ("yaml", "json"):
+                click.echo(f"Unknown format {args[1]!r}, use yaml or json")
+                return
+        else:
+            output_format = "json" if output_file.suffix == ".json" else "yaml"
+
+        try:
+            openapi_spec = self._converter.convert_parsed(self._schema)
+            _write_spec(openapi_spec, output_file, output_format)
+            click.echo(f"Conversion complete: {output_file}")
+        except Exception as e:
+            click.echo(f"Error: {e}", err=True)
+
+    def do_info(self, arg: str) -> None:
+        """info: display information about the loaded schema"""
+        if self._schema is None:
+            click.echo("No schema loaded, use: load XSD_FILE")
+            return
+        try:
+            _echo_schema_info(self._converter.analyze_parsed(self._schema))
+        except Exception as e:
+            click.echo(f"Error analyzing XSD: {e}", err=True)
+
+    def do_validate(self, arg: str) -> None:
+        """validate: check the loaded schema for conversion compatibility"""
+        if self._schema is None:
+            click.echo("No schema loaded, use: load XSD_FILE")
+            return
+        _echo_validation_result(self._converter.validate_parsed(self._schema))
+
+    def do_quit(self, arg: str) -> bool:
+        """quit: leave the shell"""
+        return True
+
+    do_exit = do_quit
+
+    def do_EOF(self, arg: str) -> bool:
+        """Leave the shell on end of input."""
+        click.echo()
+        return True
+
+
+@main.command()
+def serve() -> None:
+    """Start an interactive shell that keeps parsed schemas in memory.
+
+    Load an XSD once with "load", then run "convert", "info" and "validate"
+    against it without parsing the file again.
+    """
+    _ConverterShell().cmdloop()
+
+
 if __name__ == "__main__":
     main()
@@ -1,8 +1,12 @@
 """Main XSD to OpenAPI converter implementation."""
 
+import copy
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Union
 
 import xmlschema
 from xmlschema import XMLSchema
@@ -16,6 +20,283 @@ from .models import (
     XSDType,
 )
 
+# Escaped XML characters left in documentation text, undone in one pass
+_XML_ENTITY_RE = re.compile(r"&(?:lt|gt|amp);")
+_XML_ENTITIES: Dict[str, str] = {"&lt;": "<", "&gt;": ">", "&amp;": "&"}
+
+# Schemas for XSD built-in types, built once and shared. Use
+# _builtin_type_schema() for read-only lookups and
+# XSDConverter._convert_builtin_type() for a copy that may be modified.
+_BUILTIN_TYPE_MAPPINGS: Dict[str, OpenAPISchema] = {
+    # String types
+    "string": OpenAPISchema(type="string"),
+    "normalizedString": OpenAPISchema(type="string"),
+    "token": OpenAPISchema(type="string"),
+    "language": OpenAPISchema(type="string"),
+    "Name": OpenAPISchema(type="string"),
+    "NCName": OpenAPISchema(type="string"),
+    "ID": OpenAPISchema(type="string"),
+    "IDREF": OpenAPISchema(type="string"),
+    "IDREFS": OpenAPISchema(type="string"),
+    "ENTITY": OpenAPISchema(type="string"),
+    "ENTITIES": OpenAPISchema(type="string"),
+    "NMTOKEN": OpenAPISchema(type="string"),
+    "NMTOKENS": OpenAPISchema(type="string"),
+    # Numeric types
+    "decimal": OpenAPISchema(type="number"),
+    "float": OpenAPISchema(type="number", format="float"),
+    "double": OpenAPISchema(type="number", format="double"),
+    "integer": OpenAPISchema(type="integer"),
+    "nonPositiveInteger": OpenAPISchema(type="integer", maximum=0),
+    "negativeInteger": OpenAPISchema(type="integer", maximum=-1),
+    "long": OpenAPISchema(type="integer", format="int64"),
+    "int": OpenAPISchema(type="integer", format="int32"),
+    "short": OpenAPISchema(type="integer"),
+    "byte": OpenAPISchema(type="integer"),
+    "nonNegativeInteger": OpenAPISchema(type="integer", minimum=0),
+    "unsignedLong": OpenAPISchema(type="integer", minimum=0),
+    "unsignedInt": OpenAPISchema(type="integer", minimum=0),
+    "unsignedShort": OpenAPISchema(type="integer", minimum=0),
+    "unsignedByte": OpenAPISchema(type="integer", minimum=0),
+    "positiveInteger": OpenAPISchema(type="integer", minimum=1),
+    # Date/time types
+    "dateTime": OpenAPISchema(type="string", format="date-time"),
+    "date": OpenAPISchema(type="string", format="date"),
+    "time": OpenAPISchema(type="string", format="time"),
+    "duration": OpenAPISchema(type="string"),
+    "gYearMonth": OpenAPISchema(type="string"),
+    "gYear": OpenAPISchema(type="string"),
+    "gMonthDay": OpenAPISchema(type="string"),
+    "gDay": OpenAPISchema(type="string"),
+    "gMonth": OpenAPISchema(type="string"),
+    # Other types
+    "boolean": OpenAPISchema(type="boolean"),
+    "base64Binary": OpenAPISchema(type="string", format="byte"),
+    "hexBinary": OpenAPISchema(type="string", format="binary"),
+    "anyURI": OpenAPISchema(type="string", format="uri"),
+    "QName": OpenAPISchema(type="string"),
+    "NOTATION": OpenAPISchema(type="string"),
+}
+
+
+_DEFAULT_BUILTIN_SCHEMA = OpenAPISchema(type="string")
+
+
+def _builtin_type_schema(type_name: str) -> OpenAPISchema:
+    """Return the shared schema for an XSD built-in type (string if unknown)."""
+    return _BUILTIN_TYPE_MAPPINGS.get(type_name, _DEFAULT_BUILTIN_SCHEMA)
+
+
+# Schemas for well-known domain-specific type names, built once and copied
+# by XSDConverter._convert_domain_type()
+_DOMAIN_TYPE_MAPPINGS: Dict[str, OpenAPISchema] = {
+    # Money types - should be numbers with decimal constraints
+    "Money": OpenAPISchema(
+        type="number",
+        format="decimal",
+        minimum=-99999999.99,
+        maximum=99999999.99,
+        multiple_of=0.01,
+    ),
+    "PositiveMoney": OpenAPISchema(
+        type="number",
+        format="decimal",
+        minimum=0,
+        maximum=99999999.99,
+        multiple_of=0.01,
+    ),
+    # Percentage types
+    "Percent": OpenAPISchema(type="number", minimum=0, maximum=100),
+    "NonEmptyPercent": OpenAPISchema(type="number", minimum=0.01, maximum=100),
+    # String constraints with better types
+    "Guid": OpenAPISchema(type="string", format="uuid"),
+    "ConversationId": OpenAPISchema(type="string", format="uuid"),
+    # Date types
+    "Date": OpenAPISchema(type="string", format="date"),
+    # Specific ID types
+    "DemandId": OpenAPISchema(type="string", pattern=r"^\d+$"),  # Numeric string
+    "AFCaseId": OpenAPISchema(type="string", pattern=r"^\d+$"),  # Numeric string
+    "CompanyCaseId": OpenAPISchema(type="string", pattern=r"^\d+$"),  # Numeric string
+    "DocketNo": OpenAPISchema(
+        type="string", pattern=r"^\d{2}-\d{6}$"  # Format like 25-123456
+    ),
+    # Company codes
+    "Cocode": OpenAPISchema(
+        type="string",
+        pattern=r"^\d{5}$",  # 5-digit company code
+        min_length=5,
+        max_length=5,
+    ),
+    # Binary content types
+    "BinaryContent": OpenAPISchema(type="string", format="binary"),
+    "base64Binary": OpenAPISchema(type="string", format="byte"),
+    # URI types
+    "anyURI": OpenAPISchema(type="string", format="uri"),
+}
+
+
+# Model group kinds, as reported by the ``model`` attribute of xmlschema
+# groups. The strings are not interned by xmlschema, so compare with ==.
+_SEQUENCE_MODEL = "sequence"
+_CHOICE_MODEL = "choice"
+
+# Stands in for the model of components that are not model groups
+_NO_MODEL = object()
+
+
+def _set_facet(*attributes: str, **flags: bool) -> Callable[[OpenAPISchema, Any], None]:
+    """Build a setter that copies a facet value onto schema attributes."""
+
+    def setter(schema: OpenAPISchema, value: Any) -> None:
+        for attribute in attributes:
+            setattr(schema, attribute, value)
+        for attribute, flag in flags.items():
+            setattr(schema, attribute, flag)
+
+    return setter
+
+
+# XSD facets that map directly onto OpenAPI schema attributes
+_FACET_SETTERS: Dict[str, Callable[[OpenAPISchema, Any], None]] = {
+    "length": _set_facet("min_length", "max_length"),
+    "minLength": _set_facet("min_length"),
+    "maxLength": _set_facet("max_length"),
+    "pattern": _set_facet("pattern"),
+    "minInclusive": _set_facet("minimum"),
+    "maxInclusive": _set_facet("maximum"),
+    "minExclusive": _set_facet("minimum", exclusive_minimum=True),
+    "maxExclusive": _set_facet("maximum", exclusive_maximum=True),
+}
+
+# Powers of ten for the totalDigits/fractionDigits values seen in practice;
+# other exponents fall back to computing the power
+_POW10: Dict[int, int] = {exponent: 10**exponent for exponent in range(40)}
+_NEG_POW10: Dict[int, float] = {exponent: 10**-exponent for exponent in range(20)}
+
+
+def _cached_by_class(predicate: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Memoize a duck-typing predicate on the class of its argument.
+
+    xmlschema components of the same class always expose the same
+    attributes, and is_simple()/is_complex() are static, so the hasattr()
+    probes only need to run once per class.
+    """
+    results: Dict[type, bool] = {}
+
+    @wraps(predicate)
+    def wrapper(obj: Any) -> bool:
+        cls = type(obj)
+        try:
+            return results[cls]
+        except KeyError:
+            result = results[cls] = predicate(obj)
+            return result
+
+    return wrapper
+
+
+@_cached_by_class
+def _is_simple_type(type_def: Any) -> bool:
+    """Return True for XSD simple type definitions."""
+    return hasattr(type_def, "is_simple") and type_def.is_simple()
+
+
+@_cached_by_class
+def _is_complex_type(type_def: Any) -> bool:
+    """Return True for XSD complex type definitions."""
+    return hasattr(type_def, "is_complex") and type_def.is_complex()
+
+
+@_cached_by_class
+def _is_typed_component(component: Any) -> bool:
+    """Return True for named, typed components (elements and attributes)."""
+    return hasattr(component, "name") and hasattr(component, "type")
+
+
+@lru_cache(maxsize=4096)
+def _strip_namespace(name: str) -> str:
+    """Remove the namespace URI from a name: {http://namespace}Name -> Name.
+
+    Schemas refer to the same qualified names over and over, so results are
+    memoized. find() returns -1 for unqualified names, so the slice keeps
+    them whole.
+    """
+    return name[name.find("}") + 1 :]
+
+
+@lru_cache(maxsize=4096)
+def _component_ref(type_name: str) -> str:
+    """Return the $ref path of the component schema for a qualified type name.
+
+    Every element of a reused type refers to the same component, so the path
+    is built once per name and the string is shared by all references.
+    """
+    return f"#/components/schemas/{_strip_namespace(type_name)}"
+
+
+@lru_cache(maxsize=256)
+def _builtin_type_format(type_name: str) -> Tuple[Optional[str], Optional[str]]:
+    """Return the (type, format) pair for a possibly qualified built-in name.
+
+    Union members repeat the same few built-in types across a schema, so the
+    namespace stripping and table lookup are memoized per raw name.
+    """
+    schema = _builtin_type_schema(_strip_namespace(type_name))
+    return schema.type, schema.format
+
+
+@lru_cache(maxsize=32)
+def _load_schema(path: str, mtime_ns: int, size: int) -> XMLSchema:
+    """Parse an XSD file; modification time and size are part of the key."""
+    return XMLSchema(path)
+
+
+def _load_schema_file(xsd_file: Union[str, Path]) -> XMLSchema:
+    """Parse an XSD file, reusing the result while the file is unchanged.
+
+    Validating, analyzing and converting the same file in one process then
+    only parses it once. Only the file itself is checked for changes: edits
+    to the XSD files it includes or imports are not picked up while the
+    process runs. Sources that cannot be stat'ed, such as URLs, are parsed
+    on every call.
+    """
+    path = os.path.abspath(xsd_file)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return XMLSchema(str(xsd_file))
+    return _load_schema(path, stat.st_mtime_ns, stat.st_size)
+
+
+# Schemas with fewer named types than this are converted serially even when
+# workers are requested, since starting the pool would cost more than it saves
+_PARALLEL_MIN_TYPES = 100
+
+# Converter owned by a worker process of the parallel type conversion pool
+_worker_converter: Optional["XSDConverter"] = None
+
+
+def _init_type_worker(source: Union[str, bytes], base_url: Optional[str]) -> None:
+    """Set up a worker process with its own converter for a schema.
+
+    The schema is parsed again from its path, URL or text instead of being
+    pickled from the parent: pickling an XMLSchema drops annotations and
+    overflows the stack on schemas with many mutually referencing types.
+    """
+    global _worker_converter
+    schema = XMLSchema(source, base_url=base_url)
+    _worker_converter = XSDConverter()
+    _worker_converter._reset_schema_state(schema)
+
+
+def _convert_one_type(type_name: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Convert a single named type inside a worker process."""
+    assert _worker_converter is not None and _worker_converter.schema is not None
+    type_def = _worker_converter.schema.types[type_name]
+    clean_name = _strip_namespace(type_name)
+    schema = _worker_converter._convert_named_type(clean_name, type_def)
+    return clean_name, schema.to_dict() if schema else None
+
 
 class XSDConverter:
     """Converts XSD schemas to OpenAPI specifications."""
@@ -26,6 +307,7 @@ class XSDConverter:
         version: str = "1.0.0",
         description: Optional[str] = None,
         validate_output: bool = True,
+        workers: Optional[int] = None,
     ):
         """Initialize the converter.
 
@@ -34,37 +316,76 @@ class XSDConverter:
             version: API version
             description: API description
             validate_output: Whether to validate generated OpenAPI schema
+            workers: Number of processes used to convert named types
+                (default: convert in the current process; 0 uses all CPUs).
+                Schemas with fewer than 100 named types, and schemas passed
+                to convert_parsed that were not loaded from a URL, are always
+                converted in the current process.
         """
         self.title = title
         self.version = version
         self.description = description
         self.validate_output = validate_output
+        self.workers = workers
         self.schema: Optional[XMLSchema] = None
-        self._type_mappings: Dict[str, OpenAPISchema] = {}
+        # Path, URL or text self.schema was parsed from, for worker processes
+        self._schema_source: Optional[Union[str, bytes]] = None
+        self._target_namespace: Optional[str] = None
+        # Snapshot of self.schema.types keys; NamespaceView lookups are slow
+        self._schema_type_names: frozenset = frozenset()
+        self._simple_type_cache: Dict[int, OpenAPISchema] = {}
+        self._xml_metadata_pool: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        # Clean (namespace-free) names of types emitted as component schemas
         self._processed_types: set = set()
+        # Raw type names already known to resolve to a component $ref
+        self._reference_cache: set = set()
 
-    def convert_file(self, xsd_file: Path) -> Dict[str, Any]:
+    def convert_file(self, xsd_file: Union[str, Path]) -> Dict[str, Any]:
         """Convert an XSD file to OpenAPI specification.
 
+        The parsed schema of a local file is reused by later calls in the
+        same process until the file's modification time or size changes.
+        Changes to included or imported files are not detected; use
+        ``convert_parsed(XMLSchema(path))`` to force a fresh parse.
+
         Args:
-            xsd_file: Path to the XSD file
+            xsd_file: Path or URL of the XSD file
 
         Returns:
             OpenAPI specification as dictionary
         """
-        self.schema = XMLSchema(str(xsd_file))
+        self.schema = _load_schema_file(xsd_file)
+        self._schema_source = self.schema.url
         return self._convert_schema()
 
-    def convert_string(self, xsd_content: str) -> Dict[str, Any]:
+    def convert_string(self, xsd_content: Union[str, bytes, IO]) -> Dict[str, Any]:
         """Convert XSD content string to OpenAPI specification.
 
         Args:
-            xsd_content: XSD content as string
+            xsd_content: XSD content as a string, bytes or a file-like object
 
         Returns:
             OpenAPI specification as dictionary
         """
-        self.schema = XMLSchema(xsd_content)
+        # File-like content is read up front so worker processes can parse it
+        source = (
+            xsd_content if isinstance(xsd_content, (str, bytes)) else xsd_content.read()
+        )
+        self.schema = XMLSchema(source)
+        self._schema_source = source
+        return self._convert_schema()
+
+    def convert_parsed(self, schema: XMLSchema) -> Dict[str, Any]:
+        """Convert an already loaded XSD schema to OpenAPI specification.
+
+        Args:
+            schema: Parsed XSD schema
+
+        Returns:
+            OpenAPI specification as dictionary
+        """
+        self.schema = schema
+        self._schema_source = schema.url
         return self._convert_schema()
 
     def validate_xsd(self, xsd_file: Path) -> ValidationResult:
@@ -77,7 +398,21 @@ class XSDConverter:
             Validation result
         """
         try:
-            schema = XMLSchema(str(xsd_file))
+            schema = _load_schema_file(xsd_file)
+        except Exception as e:
+            return ValidationResult(is_valid=False, errors=[str(e)])
+        return self.validate_parsed(schema)
+
+    def validate_parsed(self, schema: XMLSchema) -> ValidationResult:
+        """Check an already loaded XSD schema for conversion compatibility.
+
+        Args:
+            schema: Parsed XSD schema
+
+        Returns:
+            Validation result
+        """
+        try:
             warnings = []
 
             # Check for unsupported features
@@ -87,8 +422,7 @@ class XSDConverter:
             # Check for complex inheritance patterns
             for type_name, type_def in schema.types.items():
                 if (
-                    hasattr(type_def, "is_complex")
-                    and type_def.is_complex()
+                    _is_complex_type(type_def)
                     and hasattr(type_def, "base_type")
                     and type_def.base_type
                 ):
@@ -112,7 +446,17 @@ class XSDConverter:
         Returns:
             Schema information
         """
-        schema = XMLSchema(str(xsd_file))
+        return self.analyze_parsed(_load_schema_file(xsd_file))
+
+    def analyze_parsed(self, schema: XMLSchema) -> SchemaInfo:
+        """Analyze an already loaded XSD schema.
+
+        Args:
+            schema: Parsed XSD schema
+
+        Returns:
+            Schema information
+        """
         info = SchemaInfo()
 
         info.target_namespace = schema.target_namespace
@@ -121,10 +465,10 @@ class XSDConverter:
 
         # Count elements
         for type_name, type_def in schema.types.items():
-            if hasattr(type_def, "is_complex") and type_def.is_complex():
+            if _is_complex_type(type_def):
                 info.complex_types_count += 1
                 info.complex_types.append(type_name)
-            elif hasattr(type_def, "is_simple") and type_def.is_simple():
+            elif _is_simple_type(type_def):
                 info.simple_types_count += 1
                 info.simple_types.append(type_name)
 
@@ -145,11 +489,28 @@ class XSDConverter:
 
         return info
 
+    def _reset_schema_state(self, schema: XMLSchema) -> None:
+        """Make ``schema`` the current schema and clear per-schema state.
+
+        Used for every conversion and by the parallel pool's worker
+        processes, so both start from the same state.
+        """
+        self.schema = schema
+        self._target_namespace = schema.target_namespace
+        self._schema_type_names = frozenset(schema.types)
+        self._simple_type_cache = {}
+        self._xml_metadata_pool = {}
+        self._processed_types = set()
+        self._reference_cache = set()
+
     def _convert_schema(self) -> Dict[str, Any]:
         """Convert the loaded XSD schema to OpenAPI."""
         if self.schema is None:
             raise ValueError("No schema loaded")
 
+        # Reset per-schema state so a converter instance can be reused
+        self._reset_schema_state(self.schema)
+
         # Create OpenAPI document
         doc = OpenAPIDocument()
 
@@ -173,7 +534,7 @@ class XSDConverter:
 
     def _generate_title(self) -> str:
         """Generate a title from the schema."""
-        if self.schema and self.schema.target_namespace:
+        if self.schema is not None and self.schema.target_namespace:
             # Extract meaningful name from namespace
             namespace = self.schema.target_namespace
             if "/" in namespace:
@@ -183,45 +544,139 @@ class XSDConverter:
 
     def _generate_description(self) -> str:
         """Generate a description from the schema."""
-        if self.schema and self.schema.target_namespace:
+        if self.schema is not None and self.schema.target_namespace:
             return f"API generated from XSD schema: {self.schema.target_namespace}"
         return "API generated from XSD schema"
 
     def _convert_all_types(self, doc: OpenAPIDocument) -> None:
         """Convert all types in the schema."""
-        if not self.schema:
+        if self.schema is None:
             return
 
         # FIRST: Convert all named types (components) so they're available for referencing
-        for type_name, type_def in self.schema.types.items():
-            if type_name not in self._processed_types:
-                clean_name = self._clean_element_name(type_name)
-                # Convert without referencing (since we're creating the components)
-                schema = self._convert_type(
-                    type_def, None
-                )  # Pass None to avoid self-reference
-                if schema:
-                    # Add XML metadata for named types
-                    if not schema.xml:
-                        schema.xml = {}
-                    schema.xml["name"] = clean_name
-                    if self.schema.target_namespace:
-                        schema.xml["namespace"] = self.schema.target_namespace
-
-                    doc.components["schemas"][clean_name] = schema.to_dict()
-                    self._processed_types.add(clean_name)
+        if (
+            self.workers is not None
+            and self.workers != 1
+            and len(self.schema.types) >= _PARALLEL_MIN_TYPES
+            and self._schema_source is not None
+        ):
+            self._convert_named_types_parallel(doc)
+        else:
+            named_types = [
+                (_strip_namespace(type_name), type_def)
+                for type_name, type_def in self.schema.types.items()
+            ]
+            for clean_name, type_def in named_types:
+                if clean_name not in self._processed_types:
+                    schema = self._convert_named_type(clean_name, type_def)
+                    if schema:
+                        doc.components["schemas"][clean_name] = schema
+                        self._processed_types.add(clean_name)
 
         # SECOND: Convert global elements (now they can reference the components)
+        emitted = doc.components["schemas"]
         for elem_name, element in self.schema.elements.items():
-            clean_elem_name = self._clean_element_name(elem_name)
-            # Skip if element has same name as a type (avoid duplicate/self-reference)
-            if clean_elem_name not in self._processed_types:
-                schema = self._convert_element(element)
-                if schema:
-                    doc.components["schemas"][clean_elem_name] = schema.to_dict()
+            clean_elem_name = _strip_namespace(elem_name)
+            # Skip if element has same name as an emitted component
+            # (avoid duplicate/self-reference) before doing any conversion
+            if clean_elem_name in emitted:
+                continue
+            schema = self._convert_element(element)
+            if schema:
+                emitted[clean_elem_name] = schema
+
+    def _convert_named_type(
+        self, clean_name: str, type_def: Any
+    ) -> Optional[OpenAPISchema]:
+        """Convert a named type into its component schema."""
+        # Convert without referencing (since we're creating the components)
+        schema = self._convert_type(type_def, None)  # Pass None to avoid self-reference
+        if schema:
+            # Add XML metadata for named types (copied, as it may be shared)
+            xml_metadata = dict(schema.xml) if schema.xml else {}
+            xml_metadata["name"] = clean_name
+            if self._target_namespace:
+                xml_metadata["namespace"] = self._target_namespace
+            schema.xml = xml_metadata
+        return schema
+
+    def _xml_metadata(
+        self, clean_name: str, namespace: Optional[str]
+    ) -> Dict[str, Any]:
+        """Return the XML metadata dict for a name in a namespace.
+
+        One dict is built per (name, namespace) pair and shared by every
+        schema with that name, so copy it before modifying it.
+        OpenAPISchema.to_dict() copies it into the output.
+        """
+        key = (clean_name, namespace)
+        xml_metadata = self._xml_metadata_pool.get(key)
+        if xml_metadata is None:
+            xml_metadata = {"name": clean_name}
+            if namespace:
+                xml_metadata["namespace"] = namespace
+            self._xml_metadata_pool[key] = xml_metadata
+        return xml_metadata
+
+    def _convert_named_types_parallel(self, doc: OpenAPIDocument) -> None:
+        """Convert all named types across a pool of worker processes.
+
+        Named types convert independently of each other, so each worker loads
+        its own copy of the schema and the results are merged in schema order.
+        """
+        if self.schema is None or self._schema_source is None:
+            return
+
+        type_names = list(self.schema.types)
+        max_workers = self.workers or os.cpu_count()
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_type_worker,
+            initargs=(self._schema_source, self.schema.base_url),
+        ) as executor:
+            results = executor.map(_convert_one_type, type_names, chunksize=16)
+            for clean_name, schema_dict in results:
+                if schema_dict is not None:
+                    doc.components["schemas"][clean_name] = schema_dict
+                    self._processed_types.add(clean_name)
 
     def _convert_element(self, element: Any) -> Optional[OpenAPISchema]:
         """Convert an XSD element to OpenAPI schema."""
+        type_name = getattr(element.type, "name", None) if element.type else None
+
+        # Check if this should be a reference to a component schema. A $ref
+        # schema serializes to the reference alone, so the documentation and
+        # XML metadata of the element are not needed.
+        if type_name and self._should_use_reference(type_name):
+            schema = OpenAPISchema(ref=_component_ref(type_name))
+        else:
+            schema = self._convert_inline_element(element, type_name)
+
+        # Occurrence bounds are read once and reused below
+        min_occurs = getattr(element, "min_occurs", 1)
+        max_occurs = getattr(element, "max_occurs", 1)
+
+        # Handle nullable (minOccurs=0) and nillable
+        if min_occurs == 0:
+            schema.x_nullable = True
+        elif getattr(element, "nillable", False):
+            schema.x_nullable = True
+
+        # Handle array (maxOccurs > 1)
+        if max_occurs and max_occurs != 1:
+            array_schema = OpenAPISchema(type="array", items=schema)
+            if max_occurs != "unbounded":
+                array_schema.max_items = int(max_occurs)
+            if min_occurs > 0:
+                array_schema.min_items = min_occurs
+            return array_schema
+
+        return schema
+
+    def _convert_inline_element(
+        self, element: Any, type_name: Optional[str]
+    ) -> OpenAPISchema:
+        """Convert an element whose type is not referenced as a component."""
         schema = OpenAPISchema()
 
         # Handle element name and documentation
@@ -232,92 +687,62 @@ class XSDConverter:
 
         # Add XML metadata
         if hasattr(element, "name") and element.name:
-            clean_name = self._clean_element_name(element.name)
-            xml_metadata = {"name": clean_name}
-
             # Add namespace if present
-            if hasattr(element, "target_namespace") and element.target_namespace:
-                xml_metadata["namespace"] = element.target_namespace
-            elif self.schema and self.schema.target_namespace:
-                xml_metadata["namespace"] = self.schema.target_namespace
-
-            schema.xml = xml_metadata
+            namespace = getattr(element, "target_namespace", None)
+            schema.xml = self._xml_metadata(
+                _strip_namespace(element.name), namespace or self._target_namespace
+            )
 
         # Handle type
         if element.type:
-            type_name = getattr(element.type, "name", None)
-
-            # Check if this should be a reference to a component schema
-            if type_name and self._should_use_reference(type_name):
-                clean_name = self._clean_element_name(type_name)
-                schema.ref = f"#/components/schemas/{clean_name}"
-                # Note: XML metadata is preserved in the element's XML metadata set earlier
-            else:
-                # Handle inline types (anonymous complex types or built-in types)
-                if hasattr(element.type, "base_type") or hasattr(
-                    element.type, "content_type"
-                ):
-                    type_schema = self._convert_type(element.type)
-                    if type_schema:
-                        # Merge type schema properties
-                        if type_schema.ref:
-                            schema.ref = type_schema.ref
-                        else:
-                            schema = type_schema
+            # Handle inline types (anonymous complex types or built-in types)
+            if hasattr(element.type, "base_type") or hasattr(
+                element.type, "content_type"
+            ):
+                type_schema = self._convert_type(element.type)
+                if type_schema:
+                    # Merge type schema properties
+                    if type_schema.ref:
+                        schema.ref = type_schema.ref
                     else:
-                        # If _convert_type returned None, fallback to built-in detection
-                        if type_name:
-                            clean_name = self._clean_element_name(type_name)
-                            builtin_schema = self._convert_builtin_type(clean_name)
-                            schema = builtin_schema
-                        else:
-                            schema = self._convert_builtin_type("string")
-
+                        schema = type_schema
                 else:
-                    # Built-in or domain-specific type
+                    # If _convert_type returned None, fallback to built-in detection
                     if type_name:
-                        clean_name = self._clean_element_name(type_name)
-
-                        # For built-in types (especially those with namespace), try built-in first
+                        clean_name = _strip_namespace(type_name)
                         builtin_schema = self._convert_builtin_type(clean_name)
-                        if builtin_schema.type != "string" or clean_name in [
-                            "boolean",
-                            "date",
-                            "dateTime",
-                            "decimal",
-                            "integer",
-                            "double",
-                            "float",
-                        ]:
-                            # Use builtin mapping if it's not a fallback string or is a known builtin type
-                            schema = builtin_schema
-                        else:
-                            # Try domain-specific type
-                            domain_schema = self._convert_domain_type(type_name)
-                            if domain_schema:
-                                schema = domain_schema
-                            else:
-                                # This might be an unknown type, return a basic string
-                                schema = self._convert_builtin_type("string")
+                        schema = builtin_schema
                     else:
                         schema = self._convert_builtin_type("string")
 
-        # Handle nullable (minOccurs=0) and nillable
-        if getattr(element, "min_occurs", 1) == 0:
-            schema.x_nullable = True
-        elif getattr(element, "nillable", False):
-            schema.x_nullable = True
-
-        # Handle array (maxOccurs > 1)
-        max_occurs = getattr(element, "max_occurs", 1)
-        if max_occurs and max_occurs != 1:
-            array_schema = OpenAPISchema(type="array", items=schema)
-            if max_occurs != "unbounded":
-                array_schema.max_items = int(max_occurs)
-            min_occurs = getattr(element, "min_occurs", 1)
-            if min_occurs > 0:
-                array_schema.min_items = min_occurs
-            return array_schema
+            else:
+                # Built-in or domain-specific type
+                if type_name:
+                    clean_name = _strip_namespace(type_name)
+
+                    # For built-in types (especially those with namespace), try built-in first
+                    builtin_schema = self._convert_builtin_type(clean_name)
+                    if builtin_schema.type != "string" or clean_name in [
+                        "boolean",
+                        "date",
+                        "dateTime",
+                        "decimal",
+                        "integer",
+                        "double",
+                        "float",
+                    ]:
+                        # Use builtin mapping if it's not a fallback string or is a known builtin type
+                        schema = builtin_schema
+                    else:
+                        # Try domain-specific type
+                        domain_schema = self._convert_domain_type(type_name)
+                        if domain_schema:
+                            schema = domain_schema
+                        else:
+                            # This might be an unknown type, return a basic string
+                            schema = self._convert_builtin_type("string")
+                else:
+                    schema = self._convert_builtin_type("string")
 
         return schema
 
@@ -327,8 +752,7 @@ class XSDConverter:
         """Convert an XSD type definition to OpenAPI schema."""
         # If this is a named type that should be referenced, return a reference
         if type_name and self._should_use_reference(type_name):
-            clean_name = self._clean_element_name(type_name)
-            return OpenAPISchema(ref=f"#/components/schemas/{clean_name}")
+            return OpenAPISchema(ref=_component_ref(type_name))
 
         # Check if this is a built-in XSD type (has name but no custom definition)
         actual_type_name = getattr(type_def, "name", None)
@@ -336,14 +760,22 @@ class XSDConverter:
             type_name = actual_type_name
 
         # Use duck typing to identify type classes for inline conversion
-        if hasattr(type_def, "is_simple") and type_def.is_simple():
+        if _is_simple_type(type_def):
+            if type_name == actual_type_name:
+                # Simple types are converted once per type object and copied
+                # on reuse, since callers mutate the returned schema
+                cached = self._simple_type_cache.get(id(type_def))
+                if cached is None:
+                    cached = self._convert_simple_type(type_def, type_name)
+                    self._simple_type_cache[id(type_def)] = cached
+                return copy.deepcopy(cached)
             return self._convert_simple_type(type_def, type_name)
-        elif hasattr(type_def, "is_complex") and type_def.is_complex():
+        elif _is_complex_type(type_def):
             return self._convert_complex_type(type_def, type_name)
 
         # Fallback: if it has a name, try to convert as built-in type
         if actual_type_name:
-            clean_name = self._clean_element_name(actual_type_name)
+            clean_name = _strip_namespace(actual_type_name)
             return self._convert_builtin_type(clean_name)
 
         return None
@@ -362,21 +794,18 @@ class XSDConverter:
 
         # Add XML metadata for named types
         if type_name:
-            clean_name = self._clean_element_name(type_name)
-            xml_metadata = {"name": clean_name}
-            if self.schema and self.schema.target_namespace:
-                xml_metadata["namespace"] = self.schema.target_namespace
-            schema.xml = xml_metadata
+            clean_name = _strip_namespace(type_name)
+            schema.xml = self._xml_metadata(clean_name, self._target_namespace)
 
         # Handle base type or direct built-in type
         if simple_type.base_type:
-            base_schema = self._convert_builtin_type(simple_type.base_type.name)
+            base_schema = _builtin_type_schema(simple_type.base_type.name)
             schema.type = base_schema.type
             schema.format = base_schema.format
         elif type_name:
             # If there's no base_type but we have a type_name, this might be a direct built-in type
-            clean_name = self._clean_element_name(type_name)
-            builtin_schema = self._convert_builtin_type(clean_name)
+            clean_name = _strip_namespace(type_name)
+            builtin_schema = _builtin_type_schema(clean_name)
             if builtin_schema.type != "string" or clean_name in [
                 "boolean",
                 "date",
@@ -400,12 +829,8 @@ class XSDConverter:
             union_schema = self._analyze_union_constraints(simple_type)
             if union_schema:
                 # Preserve any documentation that was set
-                if simple_type.annotation and simple_type.annotation.documentation:
-                    doc = self._extract_documentation(
-                        simple_type.annotation.documentation[0]
-                    )
-                    if doc:
-                        union_schema.description = doc
+                if schema.description:
+                    union_schema.description = schema.description
                 # Preserve XML metadata
                 if schema.xml:
                     union_schema.xml = schema.xml
@@ -416,31 +841,23 @@ class XSDConverter:
             domain_schema = self._convert_domain_type(type_name)
             if domain_schema:
                 # Use domain schema completely, don't merge
-                schema = domain_schema
                 # But preserve any documentation that was set
-                if simple_type.annotation and simple_type.annotation.documentation:
-                    doc = self._extract_documentation(
-                        simple_type.annotation.documentation[0]
-                    )
-                    if doc:
-                        schema.description = doc
+                if schema.description:
+                    domain_schema.description = schema.description
                 # Preserve XML metadata
-                if type_name:
-                    clean_name = self._clean_element_name(type_name)
-                    xml_metadata = {"name": clean_name}
-                    if self.schema and self.schema.target_namespace:
-                        xml_metadata["namespace"] = self.schema.target_namespace
-                    schema.xml = xml_metadata
+                domain_schema.xml = schema.xml
                 # Skip further processing for domain types
-                return schema
+                return domain_schema
 
         # Handle restrictions - clean facet names first
-        if hasattr(simple_type, "facets") and simple_type.facets:
-            cleaned_facets = {}
-            for facet_name, facet in simple_type.facets.items():
-                if facet_name:  # Ensure facet_name is not None
-                    clean_facet_name = self._clean_element_name(facet_name)
-                    cleaned_facets[clean_facet_name] = facet
+        facets = getattr(simple_type, "facets", None)
+        if facets:
+            strip = _strip_namespace  # local binding for the loop below
+            cleaned_facets = {
+                strip(facet_name): facet
+                for facet_name, facet in facets.items()
+                if facet_name  # Ensure facet_name is not None
+            }
             self._apply_facets(schema, cleaned_facets)
 
         # Handle enumerations
@@ -459,8 +876,9 @@ class XSDConverter:
     ) -> OpenAPISchema:
         """Convert an XSD complex type to OpenAPI schema."""
         # If this is a named type that we've seen before, return a reference
-        if type_name and type_name in self._processed_types:
-            return OpenAPISchema(ref=f"#/components/schemas/{type_name}")
+        clean_type_name = _strip_namespace(type_name) if type_name else None
+        if clean_type_name and clean_type_name in self._processed_types:
+            return OpenAPISchema(ref=_component_ref(type_name))
 
         schema = OpenAPISchema(type="object")
 
@@ -471,12 +889,8 @@ class XSDConverter:
             )
 
         # Add XML metadata for named types
-        if type_name:
-            clean_name = self._clean_element_name(type_name)
-            xml_metadata = {"name": clean_name}
-            if self.schema and self.schema.target_namespace:
-                xml_metadata["namespace"] = self.schema.target_namespace
-            schema.xml = xml_metadata
+        if clean_type_name:
+            schema.xml = self._xml_metadata(clean_type_name, self._target_namespace)
 
         schema.properties = {}
         schema.required = []
@@ -488,74 +902,84 @@ class XSDConverter:
         # Handle attributes
         if hasattr(complex_type, "attributes"):
             for attr in complex_type.attributes.values():
-                if hasattr(attr, "name") and hasattr(attr, "type"):
+                if _is_typed_component(attr):
                     attr_schema = self._convert_attribute(attr)
                     if attr_schema:
-                        clean_name = self._clean_element_name(attr.name)
-                        # Mark as XML attribute
-                        if not attr_schema.xml:
-                            attr_schema.xml = {}
-                        attr_schema.xml["attribute"] = True
-                        attr_schema.xml["name"] = clean_name
+                        clean_name = _strip_namespace(attr.name)
+                        # Mark as XML attribute (copied, as it may be shared)
+                        xml_metadata = dict(attr_schema.xml) if attr_schema.xml else {}
+                        xml_metadata["attribute"] = True
+                        xml_metadata["name"] = clean_name
+                        attr_schema.xml = xml_metadata
 
                         schema.properties[clean_name] = attr_schema
                         if getattr(attr, "use", None) == "required":
                             schema.required.append(clean_name)
 
+        # Names can be collected more than once (repeated elements, merged
+        # choices, attributes); keep the first occurrence of each
+        if len(schema.required) > 1:
+            schema.required = list(dict.fromkeys(schema.required))
+
         # Mark type as processed if it has a name
-        if type_name:
-            self._processed_types.add(type_name)
+        if clean_type_name:
+            self._processed_types.add(clean_type_name)
 
         return schema
 
     def _process_content_model(self, content: Any, schema: OpenAPISchema) -> None:
-        """Process the content model of a complex type."""
-        # Use duck typing to identify content model types
-        if hasattr(content, "model") and content.model == "sequence":
-            self._process_sequence(content, schema)
-        elif hasattr(content, "model") and content.model == "choice":
-            self._process_choice(content, schema)
-        elif hasattr(content, "model") and hasattr(content, "iter_elements"):
-            # Generic group handling
-            if content.model:
-                self._process_content_model(content.model, schema)
-        else:
-            # Fallback: iterate through elements if possible
-            if hasattr(content, "__iter__"):
-                for item in content:
+        """Process the content model of a complex type.
+
+        Nested groups are walked with an explicit stack rather than by
+        recursion. Each entry records whether it is an item of a sequence,
+        where elements become properties directly.
+        """
+        stack: List[Tuple[Any, bool]] = [(content, False)]
+        while stack:
+            node, in_sequence = stack.pop()
+
+            if in_sequence and _is_typed_component(node):  # Element
+                self._add_element_property(node, schema)
+                continue
+
+            # Use duck typing to identify content model types
+            model = getattr(node, "model", _NO_MODEL)
+            if model == _SEQUENCE_MODEL:
+                # Push in reverse so items are processed in document order
+                stack.extend((item, True) for item in reversed(list(node)))
+            elif model == _CHOICE_MODEL:
+                self._process_choice(node, schema)
+            elif model is not _NO_MODEL and hasattr(node, "iter_elements"):
+                # Other groups (xs:all) are not converted
+                pass
+            elif in_sequence and model is _NO_MODEL:
+                # Sequence items that are neither elements nor groups
+                pass
+            elif hasattr(node, "__iter__"):
+                # Fallback: iterate through elements if possible
+                for item in node:
                     if hasattr(item, "name"):  # Element
-                        elem_schema = self._convert_element(item)
-                        if elem_schema:
-                            clean_name = self._clean_element_name(item.name)
-                            schema.properties[clean_name] = elem_schema
-                            if getattr(item, "min_occurs", 1) > 0:
-                                schema.required.append(clean_name)
-
-    def _process_sequence(self, sequence: Any, schema: OpenAPISchema) -> None:
-        """Process an XSD sequence."""
-        for item in sequence:
-            if hasattr(item, "name") and hasattr(item, "type"):  # Element
-                elem_schema = self._convert_element(item)
-                if elem_schema:
-                    clean_name = self._clean_element_name(item.name)
-                    schema.properties[clean_name] = elem_schema
-                    if getattr(item, "min_occurs", 1) > 0:
-                        schema.required.append(clean_name)
-            elif hasattr(item, "model") and item.model == "choice":  # Choice
-                self._process_choice(item, schema)
-            elif hasattr(item, "model"):  # Other group types
-                self._process_content_model(item, schema)
+                        self._add_element_property(item, schema)
+
+    def _add_element_property(self, element: Any, schema: OpenAPISchema) -> None:
+        """Convert an element and add it to the properties of ``schema``."""
+        elem_schema = self._convert_element(element)
+        if elem_schema:
+            clean_name = _strip_namespace(element.name)
+            schema.properties[clean_name] = elem_schema
+            if getattr(element, "min_occurs", 1) > 0:
+                schema.required.append(clean_name)
 
     def _process_choice(self, choice: Any, schema: OpenAPISchema) -> None:
         """Process an XSD choice element - this is the key feature!"""
         choice_schemas = []
 
         for item in choice:
-            if hasattr(item, "name") and hasattr(item, "type"):  # Element
+            if _is_typed_component(item):  # Element
                 elem_schema = self._convert_element(item)
                 if elem_schema:
                     # Wrap element in an object schema
-                    clean_name = self._clean_element_name(item.name)
+                    clean_name = _strip_namespace(item.name)
                     choice_option = OpenAPISchema(
                         type="object", properties={clean_name: elem_schema}
                     )
@@ -590,118 +1014,15 @@ class XSDConverter:
 
     def _convert_builtin_type(self, type_name: str) -> OpenAPISchema:
         """Convert XSD built-in types to OpenAPI schema."""
-        type_mappings = {
-            # String types
-            "string": OpenAPISchema(type="string"),
-            "normalizedString": OpenAPISchema(type="string"),
-            "token": OpenAPISchema(type="string"),
-            "language": OpenAPISchema(type="string"),
-            "Name": OpenAPISchema(type="string"),
-            "NCName": OpenAPISchema(type="string"),
-            "ID": OpenAPISchema(type="string"),
-            "IDREF": OpenAPISchema(type="string"),
-            "IDREFS": OpenAPISchema(type="string"),
-            "ENTITY": OpenAPISchema(type="string"),
-            "ENTITIES": OpenAPISchema(type="string"),
-            "NMTOKEN": OpenAPISchema(type="string"),
-            "NMTOKENS": OpenAPISchema(type="string"),
-            # Numeric types
-            "decimal": OpenAPISchema(type="number"),
-            "float": OpenAPISchema(type="number", format="float"),
-            "double": OpenAPISchema(type="number", format="double"),
-            "integer": OpenAPISchema(type="integer"),
-            "nonPositiveInteger": OpenAPISchema(type="integer", maximum=0),
-            "negativeInteger": OpenAPISchema(type="integer", maximum=-1),
-            "long": OpenAPISchema(type="integer", format="int64"),
-            "int": OpenAPISchema(type="integer", format="int32"),
-            "short": OpenAPISchema(type="integer"),
-            "byte": OpenAPISchema(type="integer"),
-            "nonNegativeInteger": OpenAPISchema(type="integer", minimum=0),
-            "unsignedLong": OpenAPISchema(type="integer", minimum=0),
-            "unsignedInt": OpenAPISchema(type="integer", minimum=0),
-            "unsignedShort": OpenAPISchema(type="integer", minimum=0),
-            "unsignedByte": OpenAPISchema(type="integer", minimum=0),
-            "positiveInteger": OpenAPISchema(type="integer", minimum=1),
-            # Date/time types
-            "dateTime": OpenAPISchema(type="string", format="date-time"),
-            "date": OpenAPISchema(type="string", format="date"),
-            "time": OpenAPISchema(type="string", format="time"),
-            "duration": OpenAPISchema(type="string"),
-            "gYearMonth": OpenAPISchema(type="string"),
-            "gYear": OpenAPISchema(type="string"),
-            "gMonthDay": OpenAPISchema(type="string"),
-            "gDay": OpenAPISchema(type="string"),
-            "gMonth": OpenAPISchema(type="string"),
-            # Other types
-            "boolean": OpenAPISchema(type="boolean"),
-            "base64Binary": OpenAPISchema(type="string", format="byte"),
-            "hexBinary": OpenAPISchema(type="string", format="binary"),
-            "anyURI": OpenAPISchema(type="string", format="uri"),
-            "QName": OpenAPISchema(type="string"),
-            "NOTATION": OpenAPISchema(type="string"),
-        }
-
-        return type_mappings.get(type_name, OpenAPISchema(type="string"))
+        return copy.copy(_builtin_type_schema(type_name))
 
     def _convert_domain_type(self, type_name: str) -> Optional[OpenAPISchema]:
         """Convert domain-specific types to appropriate OpenAPI schemas."""
         # Remove namespace prefix if present
-        clean_type_name = (
-            self._clean_element_name(type_name) if type_name else type_name
-        )
-        domain_mappings = {
-            # Money types - should be numbers with decimal constraints
-            "Money": OpenAPISchema(
-                type="number",
-                format="decimal",
-                minimum=-99999999.99,
-                maximum=99999999.99,
-                multiple_of=0.01,
-            ),
-            "PositiveMoney": OpenAPISchema(
-                type="number",
-                format="decimal",
-                minimum=0,
-                maximum=99999999.99,
-                multiple_of=0.01,
-            ),
-            # Percentage types
-            "Percent": OpenAPISchema(type="number", minimum=0, maximum=100),
-            "NonEmptyPercent": OpenAPISchema(type="number", minimum=0.01, maximum=100),
-            # String constraints with better types
-            "Guid": OpenAPISchema(type="string", format="uuid"),
-            "ConversationId": OpenAPISchema(type="string", format="uuid"),
-            # Date types
-            "Date": OpenAPISchema(type="string", format="date"),
-            # Specific ID types
-            "DemandId": OpenAPISchema(
-                type="string", pattern=r"^\d+$"  # Numeric string
-            ),
-            "AFCaseId": OpenAPISchema(
-                type="string", pattern=r"^\d+$"  # Numeric string
-            ),
-            "CompanyCaseId": OpenAPISchema(
-                type="string", pattern=r"^\d+$"  # Numeric string
-            ),
-            "DocketNo": OpenAPISchema(
-                type="string", pattern=r"^\d{2}-\d{6}$"  # Format like 25-123456
-            ),
-            # Company codes
-            "Cocode": OpenAPISchema(
-                type="string",
-                pattern=r"^\d{5}$",  # 5-digit company code
-                min_length=5,
-                max_length=5,
-            ),
-            # Binary content types
-            "BinaryContent": OpenAPISchema(type="string", format="binary"),
-            "base64Binary": OpenAPISchema(type="string", format="byte"),
-            # URI types
-            "anyURI": OpenAPISchema(type="string", format="uri"),
-        }
-
-        # Return domain mapping if found, otherwise None
-        return domain_mappings.get(clean_type_name)
+        clean_type_name = _strip_namespace(type_name) if type_name else type_name
+        # Return a copy of the domain mapping if found, otherwise None
+        domain_schema = _DOMAIN_TYPE_MAPPINGS.get(clean_type_name)
+        return copy.copy(domain_schema) if domain_schema is not None else None
 
     def _apply_facets(self, schema: OpenAPISchema, facets: Dict[str, Any]) -> None:
         """Apply XSD facets to OpenAPI schema."""
@@ -709,28 +1030,11 @@ class XSDConverter:
         fraction_digits = None
 
         for facet_name, facet in facets.items():
-            facet_value = (
-                getattr(facet, "value", facet) if hasattr(facet, "value") else facet
-            )
+            facet_value = getattr(facet, "value", facet)
 
-            if facet_name == "length":
-                schema.min_length = schema.max_length = facet_value
-            elif facet_name == "minLength":
-                schema.min_length = facet_value
-            elif facet_name == "maxLength":
-                schema.max_length = facet_value
-            elif facet_name == "pattern":
-                schema.pattern = facet_value
-            elif facet_name == "minInclusive":
-                schema.minimum = facet_value
-            elif facet_name == "maxInclusive":
-                schema.maximum = facet_value
-            elif facet_name == "minExclusive":
-                schema.minimum = facet_value
-                schema.exclusive_minimum = True
-            elif facet_name == "maxExclusive":
-                schema.maximum = facet_value
-                schema.exclusive_maximum = True
+            setter = _FACET_SETTERS.get(facet_name)
+            if setter is not None:
+                setter(schema, facet_value)
             elif facet_name == "totalDigits":
                 total_digits = facet_value
             elif facet_name == "fractionDigits":
@@ -751,7 +1055,7 @@ class XSDConverter:
         if fraction_digits == 0:
             schema.type = "integer"
             # Set min/max based on total digits
-            max_value = 10**total_digits - 1
+            max_value = (_POW10.get(total_digits) or 10**total_digits) - 1
             schema.minimum = -max_value
             schema.maximum = max_value
         else:
@@ -760,15 +1064,17 @@ class XSDConverter:
             # Calculate precision based on total digits
             if fraction_digits is not None:
                 integer_digits = total_digits - fraction_digits
-                max_integer_part = 10**integer_digits - 1
-                fraction_part = 10 ** (-fraction_digits)
+                max_integer_part = (
+                    _POW10.get(integer_digits) or 10**integer_digits
+                ) - 1
+                fraction_part = _NEG_POW10.get(fraction_digits) or 10**-fraction_digits
                 max_value = max_integer_part + (1 - fraction_part)
                 schema.minimum = -max_value
                 schema.maximum = max_value
                 schema.multiple_of = fraction_part
             else:
                 # Default decimal handling
-                max_value = 10**total_digits - 1
+                max_value = (_POW10.get(total_digits) or 10**total_digits) - 1
                 schema.minimum = -max_value
                 schema.maximum = max_value
 
@@ -778,32 +1084,30 @@ class XSDConverter:
 
         # Handle member_types from union
         if hasattr(simple_type, "member_types") and simple_type.member_types:
+            strip = _strip_namespace  # local binding for the facet loops below
             for member_type in simple_type.member_types:
                 member_schema = OpenAPISchema()
 
                 # Handle atomic built-in types (like xs:date)
                 if hasattr(member_type, "name") and member_type.name:
                     # This is a direct built-in type like xs:date
-                    base_type_name = self._clean_element_name(member_type.name)
-                    base_schema = self._convert_builtin_type(base_type_name)
-                    member_schema.type = base_schema.type
-                    member_schema.format = base_schema.format
+                    member_schema.type, member_schema.format = _builtin_type_format(
+                        member_type.name
+                    )
                 elif hasattr(member_type, "base_type") and member_type.base_type:
                     # This is a restriction with a base type
-                    base_type_name = self._clean_element_name(
+                    member_schema.type, member_schema.format = _builtin_type_format(
                         member_type.base_type.name
                     )
-                    base_schema = self._convert_builtin_type(base_type_name)
-                    member_schema.type = base_schema.type
-                    member_schema.format = base_schema.format
 
                 # Apply facets from this member type, cleaning facet names
-                if hasattr(member_type, "facets") and member_type.facets:
-                    cleaned_facets = {}
-                    for facet_name, facet in member_type.facets.items():
-                        if facet_name:  # Ensure facet_name is not None
-                            clean_facet_name = self._clean_element_name(facet_name)
-                            cleaned_facets[clean_facet_name] = facet
+                facets = getattr(member_type, "facets", None)
+                if facets:
+                    cleaned_facets = {
+                        strip(facet_name): facet
+                        for facet_name, facet in facets.items()
+                        if facet_name  # Ensure facet_name is not None
+                    }
                     self._apply_facets(member_schema, cleaned_facets)
 
                 union_schemas.append(member_schema)
@@ -813,7 +1117,7 @@ class XSDConverter:
             # Handle memberTypes="xs:date xs:string" format
             for member_type_name in simple_type._memberTypes:
                 if member_type_name:
-                    clean_name = self._clean_element_name(member_type_name)
+                    clean_name = _strip_namespace(member_type_name)
                     member_schema = self._convert_builtin_type(clean_name)
                     union_schemas.append(member_schema)
 
@@ -827,52 +1131,53 @@ class XSDConverter:
     def _count_choice_elements(self, schema: XMLSchema) -> int:
         """Count choice elements in the schema."""
         count = 0
-
-        def count_in_component(component):
-            nonlocal count
-            if hasattr(component, "model") and component.model == "choice":
+        stack: List[Any] = [
+            getattr(type_def, "content", None) for type_def in schema.types.values()
+        ]
+
+        # Walk the model groups iteratively rather than recursing. Only groups
+        # are descended into: iterating an element yields just the elements of
+        # its type (never a choice group) and can loop on recursive types.
+        while stack:
+            component = stack.pop()
+            model = getattr(component, "model", None)
+            if model is None:
+                continue
+            if model == _CHOICE_MODEL:
                 count += 1
-            if hasattr(component, "__iter__"):
-                try:
-                    for item in component:
-                        count_in_component(item)
-                except:
-                    pass
-
-        for type_def in schema.types.values():
-            if hasattr(type_def, "content") and type_def.content:
-                count_in_component(type_def.content)
+            stack.extend(component)
 
         return count
 
     def _clean_documentation(self, doc: str) -> str:
         """Clean up documentation text."""
         # Remove extra whitespace and normalize
-        doc = re.sub(r"\s+", " ", doc.strip())
+        doc = " ".join(doc.split())
         # Remove common XML artifacts
-        doc = doc.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
+        if "&" in doc:
+            doc = _XML_ENTITY_RE.sub(lambda match: _XML_ENTITIES[match[0]], doc)
         return doc
 
     def _clean_element_name(self, name: str) -> str:
         """Remove namespace prefix from element names."""
-        if "}" in name:
-            # Remove namespace URI: {http://namespace}ElementName -> ElementName
-            return name.split("}")[1]
-        return name
+        return _strip_namespace(name)
 
     def _should_use_reference(self, type_name: str) -> bool:
         """Determine if a type should use a $ref instead of inline definition."""
-        if not type_name or not self.schema:
+        if not type_name or self.schema is None:
             return False
 
-        clean_name = self._clean_element_name(type_name)
-
-        # Check if this is a named type in the schema that should be referenced
-        if clean_name in self.schema.types:
+        # Positive answers never change during a run (_processed_types only
+        # grows), so they are cached; negative answers are recomputed
+        if type_name in self._reference_cache:
             return True
 
-        # Check if we've already processed this type (it exists in components)
-        if clean_name in self._processed_types:
+        clean_name = _strip_namespace(type_name)
+
+        # Check if this is a named type in the schema that should be referenced,
+        # or one we've already processed (it exists in components)
+        if clean_name in self._schema_type_names or clean_name in self._processed_types:
+            self._reference_cache.add(type_name)
             return True
 
         return False
@@ -887,30 +1192,30 @@ class XSDConverter:
 
         # Method 1: Direct text attribute
         if hasattr(doc_element, "text") and doc_element.text:
-            text_content = doc_element.text.strip()
+            text_content = doc_element.text
+        else:
+            as_string = str(doc_element)
 
-        # Method 2: String conversion and check if it looks like XML element object
-        elif not (
-            str(doc_element).startswith("<Element")
-            and "documentation" in str(doc_element)
-        ):
-            # Only use string conversion if it doesn't look like an XML element object
-            text_content = str(doc_element).strip()
-
-        # Method 3: Try to get text from element tree
-        elif hasattr(doc_element, "tag"):
-            try:
-                # Try to extract text from XML element
-                if doc_element.text:
-                    text_content = doc_element.text.strip()
-                elif len(doc_element) == 0:
-                    # Element has no children, might be empty
-                    text_content = ""
-            except:
-                pass
+            # Method 2: String conversion and check if it looks like XML element object
+            if not (as_string.startswith("<Element") and "documentation" in as_string):
+                # Only use string conversion if it doesn't look like an XML element
+                text_content = as_string
+
+            # Method 3: Try to get text from element tree
+            elif hasattr(doc_element, "tag"):
+                try:
+                    # Try to extract text from XML element
+                    if doc_element.text:
+                        text_content = doc_element.text
+                    elif len(doc_element) == 0:
+                        # Element has no children, might be empty
+                        text_content = ""
+                except (AttributeError, TypeError):
+                    # No usable text or no len() on this element type
+                    pass
 
-        # Clean and return
-        if text_content and text_content.strip():
+        # Clean and return; _clean_documentation() trims the text itself
+        if text_content and not text_content.isspace():
             return self._clean_documentation(text_content)
         else:
             # Return None instead of empty string or XML object representation
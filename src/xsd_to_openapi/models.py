@@ -1,10 +1,16 @@
 """Data models for XSD to OpenAPI conversion."""
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
+# Large schemas create many model instances (OpenAPISchema above all);
+# __slots__ makes them smaller and faster to create where dataclasses support
+# it (Python 3.10+)
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class OpenAPISchema:
     """Represents an OpenAPI schema object."""
 
@@ -147,12 +153,13 @@ class OpenAPISchema:
 
         # Standard XML metadata
         if self.xml:
-            result["xml"] = self.xml
+            # Copied because converters share xml dicts between schemas
+            result["xml"] = dict(self.xml)
 
         return result
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ValidationResult:
     """Result of XSD validation."""
 
@@ -161,7 +168,7 @@ class ValidationResult:
     warnings: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SchemaInfo:
     """Information about an XSD schema."""
 
@@ -183,7 +190,7 @@ class SchemaInfo:
     global_elements: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ChoiceElement:
     """Represents an XSD choice element."""
 
@@ -192,7 +199,7 @@ class ChoiceElement:
     elements: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class XSDType:
     """Represents an XSD type definition."""
 
@@ -208,7 +215,7 @@ class XSDType:
     documentation: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class OpenAPIDocument:
     """Represents a complete OpenAPI document."""
 
@@ -230,7 +237,19 @@ class OpenAPIDocument:
         }
 
         if self.components:
-            result["components"] = self.components
+            # Component schemas are kept as OpenAPISchema objects while the
+            # document is built and serialized here in a single pass
+            components = dict(self.components)
+            if "schemas" in components:
+                components["schemas"] = {
+                    name: (
+                        schema.to_dict()
+                        if isinstance(schema, OpenAPISchema)
+                        else schema
+                    )
+                    for name, schema in components["schemas"].items()
+                }
+            result["components"] = components
         if self.servers:
             result["servers"] = self.servers
         if self.security:
@@ -0,0 +1,144 @@
+"""Serialization of generated OpenAPI specifications to JSON and YAML."""
+
+import json
+from decimal import Decimal
+from functools import lru_cache
+from typing import IO, Any, Dict, Optional
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - optional speedup
+    _HAS_ORJSON = False
+
+
+def _represent_decimal(dumper: Any, value: Decimal) -> Any:
+    """Emit XSD decimal facet values as plain YAML numbers."""
+    return dumper.represent_float(float(value))
+
+
+def _represent_atomic(dumper: Any, value: Any) -> Any:
+    """Emit XSD date, time and duration facet values in their lexical form."""
+    return dumper.represent_str(str(value))
+
+
+@lru_cache(maxsize=None)
+def _spec_dumper() -> Any:
+    """Build the YAML dumper for OpenAPI specs.
+
+    PyYAML is imported here rather than at module level so that JSON-only
+    runs do not pay for it. The dumper is backed by libyaml when available.
+    """
+    import yaml
+    from elementpath.datatypes import AnyAtomicType
+
+    try:
+        base = yaml.CSafeDumper
+    except AttributeError:  # pragma: no cover - PyYAML built without libyaml
+        base = yaml.SafeDumper
+
+    class SpecDumper(base):  # type: ignore[misc,valid-type]
+        """YAML dumper for OpenAPI specs."""
+
+    SpecDumper.add_representer(Decimal, _represent_decimal)
+    SpecDumper.add_multi_representer(AnyAtomicType, _represent_atomic)
+    return SpecDumper
+
+
+def _json_default(value: Any) -> Any:
+    """Convert values the JSON encoders do not handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    # Only reached for values orjson and json cannot encode, so importing
+    # elementpath here keeps it out of the module import
+    from elementpath.datatypes import AnyAtomicType
+
+    if isinstance(value, AnyAtomicType):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Mapping levels written key by key: the document, ``components`` and
+# ``components.schemas``. Anything deeper is encoded in one call.
+_JSON_STREAM_DEPTH = 3
+
+
+def _dumps_indented(value: Any) -> bytes:
+    """Encode ``value`` as JSON indented by two spaces.
+
+    orjson rejects integers outside the 64-bit range, which XSD decimal
+    facets can produce; those values are encoded by the standard library.
+    """
+    try:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_INDENT_2)
+    except orjson.JSONEncodeError:
+        return json.dumps(
+            value, indent=2, ensure_ascii=False, default=_json_default
+        ).encode("utf-8")
+
+
+def _stream_orjson(value: Any, stream: IO[bytes], depth: int) -> None:
+    """Write ``value`` as indented JSON one top-level entry at a time.
+
+    The output matches ``orjson.dumps(value, option=orjson.OPT_INDENT_2)``,
+    but only a single component schema is held in memory as encoded bytes.
+    """
+    if depth >= _JSON_STREAM_DEPTH or not isinstance(value, dict) or not value:
+        data = _dumps_indented(value)
+        if depth:
+            # Encoded strings never contain raw newlines, so this only
+            # touches the line breaks added by the indentation
+            data = data.replace(b"\n", b"\n" + b"  " * depth)
+        stream.write(data)
+        return
+
+    separator = b"\n" + b"  " * (depth + 1)
+    stream.write(b"{")
+    for index, (key, item) in enumerate(value.items()):
+        stream.write((b"," if index else b"") + separator)
+        stream.write(orjson.dumps(key) + b": ")
+        _stream_orjson(item, stream, depth + 1)
+    stream.write(b"\n" + b"  " * depth + b"}")
+
+
+def write_json(spec: Dict[str, Any], stream: IO[bytes]) -> None:
+    """Write an OpenAPI specification as indented UTF-8 JSON.
+
+    The document is streamed to ``stream`` instead of being rendered into a
+    single string first. Uses orjson when it is installed and falls back to
+    the standard library.
+
+    Args:
+        spec: OpenAPI specification as dictionary
+        stream: Binary stream to write to
+    """
+    if _HAS_ORJSON:
+        _stream_orjson(spec, stream, 0)
+        return
+
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default)
+    for chunk in encoder.iterencode(spec):
+        stream.write(chunk.encode("utf-8"))
+
+
+def write_yaml(spec: Dict[str, Any], stream: Optional[IO[str]] = None) -> Any:
+    """Write an OpenAPI specification as block-style YAML.
+
+    Args:
+        spec: OpenAPI specification as dictionary
+        stream: Text stream to write to, or None to return the YAML document
+
+    Returns:
+        The YAML document as a string when no stream is given, else None
+    """
+    import yaml
+
+    return yaml.dump(
+        spec,
+        stream,
+        Dumper=_spec_dumper(),
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+    )
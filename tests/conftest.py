@@ -0,0 +1,67 @@
+"""Shared fixtures for the XSD to OpenAPI converter tests."""
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+
+import pytest
+
+# Make the package importable from a source checkout without installing it
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Import the converter (and xmlschema with it) while the session starts, so
+# the import is not billed to whichever test happens to run first
+from xsd_to_openapi import XSDConverter  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def converter():
+    """A converter shared by all tests; it resets its state on each conversion."""
+    return XSDConverter(
+        title="Test Schema", version="1.0.0", description="Test conversion"
+    )
+
+
+@pytest.fixture(scope="session")
+def convert(converter):
+    """Convert XSD content, converting each distinct input only once.
+
+    Results are shared between tests, so they are returned as read-only
+    mappings.
+    """
+
+    @lru_cache(maxsize=64)
+    def convert(xsd_content):
+        return MappingProxyType(converter.convert_string(xsd_content))
+
+    return convert
+
+
+@contextmanager
+def _tmp_xsd(content):
+    """Expose XSD content as a file path, in memory where the OS allows it."""
+    if hasattr(os, "memfd_create"):
+        # Linux: an anonymous in-memory file, reachable through /proc
+        fd = os.memfd_create("xsd")
+        try:
+            os.write(fd, content)
+            yield Path(f"/proc/self/fd/{fd}")
+        finally:
+            os.close(fd)
+    else:
+        with tempfile.NamedTemporaryFile(suffix=".xsd", delete=False) as f:
+            f.write(content)
+        try:
+            yield Path(f.name)
+        finally:
+            os.unlink(f.name)
+
+
+@pytest.fixture
+def tmp_xsd():
+    """Context manager factory for tests that need an XSD file path."""
+    return _tmp_xsd
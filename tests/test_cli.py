@@ -0,0 +1,130 @@
+"""Tests for the command-line interface."""
+
+import pytest
+from click.testing import CliRunner
+
+from xsd_to_openapi import cli
+from xsd_to_openapi.converter import XSDConverter
+
+SCHEMA_XSD = b"""<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema"
+           xmlns:tns="http://example.com/cli"
+           targetNamespace="http://example.com/cli"
+           elementFormDefault="qualified">
+    <xs:element name="Person" type="tns:PersonType"/>
+
+    <xs:complexType name="PersonType">
+        <xs:annotation><xs:documentation>A person</xs:documentation></xs:annotation>
+        <xs:sequence>
+            <xs:element name="name" type="xs:string"/>
+        </xs:sequence>
+    </xs:complexType>
+</xs:schema>"""
+
+INVALID_XSD = b"""<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+    <xs:element name="broken" type="Missing"/>
+</xs:schema>"""
+
+
+@pytest.fixture
+def xsd_file(tmp_path):
+    """A valid XSD file on disk."""
+    path = tmp_path / "person.xsd"
+    path.write_bytes(SCHEMA_XSD)
+    return path
+
+
+def test_convert_cache_hit(xsd_file, tmp_path, monkeypatch):
+    """Test that a cached spec is reused and written identically."""
+    monkeypatch.setattr(cli, "CACHE_DIR", tmp_path / "cache")
+    runner = CliRunner()
+    first = tmp_path / "first.yaml"
+    second = tmp_path / "second.yaml"
+
+    result = runner.invoke(cli.main, ["convert", str(xsd_file), str(first), "--cache"])
+    assert result.exit_code == 0, result.output
+    assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+    # A cache hit must not convert the file again
+    def fail(*args, **kwargs):
+        raise AssertionError("schema converted despite a cache hit")
+
+    monkeypatch.setattr(XSDConverter, "convert_file", fail)
+    result = runner.invoke(cli.main, ["convert", str(xsd_file), str(second), "--cache"])
+    assert result.exit_code == 0, result.output
+    assert second.read_bytes() == first.read_bytes()
+    assert "A person" in second.read_text(encoding="utf-8")
+
+
+def test_convert_many_reports_failures(xsd_file, tmp_path):
+    """Test that convert-many converts what it can and exits non-zero."""
+    invalid_file = tmp_path / "invalid.xsd"
+    invalid_file.write_bytes(INVALID_XSD)
+    output_dir = tmp_path / "out"
+
+    result = CliRunner().invoke(
+        cli.main,
+        ["convert-many", str(xsd_file), str(invalid_file), "-o", str(output_dir)],
+    )
+    assert result.exit_code == 1
+    assert f"Error converting {invalid_file}" in result.output
+    assert "1 of 2 files failed" in result.output
+    assert sorted(p.name for p in output_dir.iterdir()) == ["person.yaml"]
+
+
+def test_convert_many_rejects_clashing_names(xsd_file, tmp_path):
+    """Test that inputs with the same name are rejected before converting."""
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    other_file = other_dir / xsd_file.name
+    other_file.write_bytes(SCHEMA_XSD)
+    output_dir = tmp_path / "out"
+
+    result = CliRunner().invoke(
+        cli.main,
+        ["convert-many", str(xsd_file), str(other_file), "-o", str(output_dir)],
+    )
+    assert result.exit_code == 1
+    assert "would overwrite each other" in result.output
+    assert not output_dir.exists()
+
+
+def test_serve_load_convert_info(xsd_file, tmp_path):
+    """Test the load, convert and info commands of the interactive shell."""
+    output_file = tmp_path / "person.json"
+    commands = [
+        f"load {xsd_file}",
+        f"convert {output_file}",
+        f"convert {tmp_path / 'person.xml'} xml",
+        "info",
+        "quit",
+    ]
+
+    result = CliRunner().invoke(cli.main, ["serve"], input="\n".join(commands))
+    assert result.exit_code == 0, result.output
+    assert f"Loaded {xsd_file}" in result.output
+    assert f"Conversion complete: {output_file}" in result.output
+    assert "Unknown format 'xml', use yaml or json" in result.output
+    assert "Complex Types: 1" in result.output
+    assert output_file.read_text(encoding="utf-8").startswith("{")
+    assert not (tmp_path / "person.xml").exists()
+
+
+def test_failed_write_leaves_no_file(tmp_path):
+    """Test that a spec that fails to serialize leaves no output behind."""
+    output_file = tmp_path / "spec.json"
+    output_file.write_text("previous", encoding="utf-8")
+
+    with pytest.raises(TypeError):
+        cli._write_spec({"openapi": "3.0.3", "bad": object()}, output_file, "json")
+
+    assert output_file.read_text(encoding="utf-8") == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["spec.json"]
+
+
+if __name__ == "__main__":
+    # Run the tests with pytest, so fixtures and plugins apply as usual
+    import sys
+
+    sys.exit(pytest.main([__file__]))